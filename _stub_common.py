@@ -0,0 +1,54 @@
+"""Primitives shared by the sandbox stubs (*fastapi.py*, *sitecustomize.py*
+and the *conftest* fallback shims).
+
+The *fastapi* stubs need the same two trivial callables – a helper that
+swallows any arguments and returns ``None`` (used for the
+``fastapi.openapi.docs`` ``get_*_html`` functions) and a pass-through
+decorator for route registration.  Defining them once here means every stub
+refers to the very same function objects instead of re-creating private
+copies.
+
+The ``pytest_asyncio`` stand-ins of *sitecustomize.py* and *conftest.py* share
+the session event loop through ``get_loop`` in the same way, so async
+fixtures and the tests consuming them always run on one loop.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable
+
+if TYPE_CHECKING:  # pragma: no cover
+    import asyncio
+
+
+def _identity(*_args: Any, **_kwargs: Any) -> None:  # noqa: D401 – returns None
+    return None
+
+
+def _noop_decorator(func: Callable[..., Any]) -> Callable[..., Any]:  # noqa: D401
+    return func
+
+
+# One persistent loop for every async fixture and test – created on first use
+# (``asyncio`` is only imported then) and closed at interpreter exit.  It is
+# also installed as the current loop so that synchronous code calling
+# ``asyncio.get_event_loop()`` sees the very same loop.
+_LOOP: asyncio.AbstractEventLoop | None = None
+
+
+def get_loop() -> asyncio.AbstractEventLoop:  # noqa: D401 – lazy accessor
+    global _LOOP
+    if _LOOP is None or _LOOP.is_closed():
+        import asyncio
+        import atexit
+
+        _LOOP = asyncio.new_event_loop()
+        asyncio.set_event_loop(_LOOP)
+        atexit.register(_LOOP.close)
+    return _LOOP
+
+
+IDENTITY = _identity
+NOOP_DECORATOR = _noop_decorator
+
+__all__ = ["IDENTITY", "NOOP_DECORATOR", "get_loop"]
@@ -17,10 +17,32 @@ sub-module.
 
 from __future__ import annotations
 
+import functools
 import sys
 import types
 from enum import Enum
-from typing import Any, List, Tuple
+
+# Annotations are never evaluated at runtime (``from __future__ import
+# annotations``), so the *typing* names are only needed by static checkers.
+# A plain ``False`` constant – rather than ``typing.TYPE_CHECKING`` – keeps
+# the stub from importing :mod:`typing` at all.
+TYPE_CHECKING = False
+if TYPE_CHECKING:  # pragma: no cover – static analysis only
+    from typing import Any, Tuple
+
+
+@functools.cache
+def _any_schema():  # noqa: D401 – memoised pydantic helper
+    """Return the catch-all *any* schema handed to pydantic by every stub class.
+
+    ``pydantic_core`` is imported on the first schema request only – the hooks
+    are never invoked without pydantic – and the result is cached so nested
+    models asking repeatedly get the same object back.
+    """
+
+    from pydantic_core import core_schema
+
+    return core_schema.any_schema()
 
 
 # ---------------------------------------------------------------------------
@@ -36,15 +58,13 @@ class _Placeholder:  # noqa: D401 – simple empty placeholder
     """A very small stand-in used for the vast majority of imported names."""
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: D401
-        for k, v in kwargs.items():
-            setattr(self, k, v)
+        if kwargs:
+            self.__dict__.update(kwargs)
 
     # Make pydantic treat *any* subclass as arbitrary type
     @classmethod  # noqa: D401
     def __get_pydantic_core_schema__(cls, _source_type, _handler):  # type: ignore[override]
-        from pydantic_core import core_schema
-
-        return core_schema.any_schema()
+        return _any_schema()
 
 
 # ---------------------------------------------------------------------------
@@ -52,14 +72,62 @@ class _Placeholder:  # noqa: D401 – simple empty placeholder
 # ---------------------------------------------------------------------------
 
 
-def _register(path: str) -> types.ModuleType:  # noqa: D401 – short helper
-    """Create *and* register a new module object under *path* in ``sys.modules``."""
-
-    mod = types.ModuleType(path)
-    sys.modules[path] = mod
+def _register(path: str, _modules=sys.modules) -> types.ModuleType:  # noqa: D401 – short helper
+    """Return the stub module for *path*, creating and registering it if needed.
+
+    Only modules created by this stub (flagged with ``_docling_core_stub``) are
+    reused – a real *docling_core* that was imported first is replaced rather
+    than patched.  On a re-import (e.g. ``importlib.reload`` in a fixture) the
+    reused module is emptied so that the lazy builders repopulate it with the
+    freshly defined classes.
+    """
+
+    mod = _modules.get(path)
+    if mod is None or not mod.__dict__.get("_docling_core_stub", False):
+        mod = types.ModuleType(path)
+        mod._docling_core_stub = True  # type: ignore[attr-defined]
+        _modules[path] = mod
+        return mod
+
+    ns = mod.__dict__
+    for key in [k for k in ns if k[:2] != "__" and k != "_docling_core_stub"]:
+        del ns[key]
+    ns.pop("__getattr__", None)
+    ns.pop("__all__", None)
     return mod
 
 
+# ---------------------------------------------------------------------------
+# Lazy sub-module population (PEP 562)
+# ---------------------------------------------------------------------------
+#
+# Every sub-module below is registered as an *empty* shell right away – the
+# stub packages carry no ``__path__`` so ``import docling_core.types.doc``
+# can only succeed through a ``sys.modules`` hit.  Filling in the namespaces
+# is deferred instead: each shell gets a module-level ``__getattr__`` that
+# runs its ``_build_*`` function on the first attribute miss.  Tests that
+# touch a single sub-module therefore never pay for populating the others.
+# ---------------------------------------------------------------------------
+
+
+def _install_lazy(mod: types.ModuleType, builder) -> None:  # noqa: D401 – helper
+    """Defer populating *mod* until one of its attributes is first requested."""
+
+    def __getattr__(name: str, _mod=mod, _b=builder):
+        # Drop the hook *before* building so that look-ups performed by the
+        # builder itself (and later misses) resolve normally.
+        _mod.__dict__.pop("__getattr__", None)
+        _b(_mod)
+        try:
+            return _mod.__dict__[name]
+        except KeyError:
+            raise AttributeError(
+                f"module {_mod.__name__!r} has no attribute {name!r}"
+            ) from None
+
+    mod.__getattr__ = __getattr__  # type: ignore[attr-defined]
+
+
 # Root package ``docling_core``
 pkg_root = _register("docling_core")
 
@@ -83,19 +151,29 @@ def docling_document_to_legacy(doc, *args, **kwargs):  # noqa: D401 – stub con
     return {}
 
 
-pkg_utils.resolve_source_to_stream = resolve_source_to_stream  # type: ignore[attr-defined]
-pkg_utils.docling_document_to_legacy = docling_document_to_legacy  # type: ignore[attr-defined]
+def _build_utils(mod: types.ModuleType) -> None:
+    mod.resolve_source_to_stream = resolve_source_to_stream  # type: ignore[attr-defined]
+    mod.docling_document_to_legacy = docling_document_to_legacy  # type: ignore[attr-defined]
+
+    # Ensure attribute exposure on parent ``utils``
+    mod.file = pkg_utils_file  # type: ignore[attr-defined]
+    mod.legacy = pkg_utils_legacy  # type: ignore[attr-defined]
+
 
 # Explicit sub-modules referenced by import paths
 pkg_utils_file = _register("docling_core.utils.file")
-pkg_utils_file.resolve_source_to_stream = resolve_source_to_stream  # type: ignore[attr-defined]
+
+
+def _build_utils_file(mod: types.ModuleType) -> None:
+    mod.resolve_source_to_stream = resolve_source_to_stream  # type: ignore[attr-defined]
+
 
 pkg_utils_legacy = _register("docling_core.utils.legacy")
-pkg_utils_legacy.docling_document_to_legacy = docling_document_to_legacy  # type: ignore[attr-defined]
 
-# Ensure attribute exposure on parent ``utils``
-pkg_utils.file = pkg_utils_file  # type: ignore[attr-defined]
-pkg_utils.legacy = pkg_utils_legacy  # type: ignore[attr-defined]
+
+def _build_utils_legacy(mod: types.ModuleType) -> None:
+    mod.docling_document_to_legacy = docling_document_to_legacy  # type: ignore[attr-defined]
+
 
 # ---------------------------------------------------------------------------
 # ``docling_core.types.legacy_doc`` hierarchy – only placeholders.
@@ -111,35 +189,43 @@ class _LegacyPlaceholder(_Placeholder):
     pass
 
 
-# Define all names referenced by the code base / tests
-_legacy_base_objects = {
-    "BaseText": _LegacyPlaceholder,
-    "Figure": _LegacyPlaceholder,
-    "GlmTableCell": _LegacyPlaceholder,
-    "PageDimensions": _LegacyPlaceholder,
-    "PageReference": _LegacyPlaceholder,
-    "Prov": _LegacyPlaceholder,
-    "Ref": _LegacyPlaceholder,
-    "Table": _LegacyPlaceholder,
-    "TableCell": _LegacyPlaceholder,
-}
+def _build_legacy_base(mod: types.ModuleType) -> None:
+    # Define all names referenced by the code base / tests
+    _legacy_base_objects = dict.fromkeys(
+        (
+            "BaseText",
+            "Figure",
+            "GlmTableCell",
+            "PageDimensions",
+            "PageReference",
+            "Prov",
+            "Ref",
+            "Table",
+            "TableCell",
+        ),
+        _LegacyPlaceholder,
+    )
+
+    mod.__dict__.update(_legacy_base_objects)
 
-pkg_legacy_base.__dict__.update(_legacy_base_objects)
 
 # Document sub-module
 pkg_legacy_document = _register("docling_core.types.legacy_doc.document")
 
-_legacy_document_objects = {
-    "CCSDocumentDescription": _LegacyPlaceholder,
-    "CCSFileInfoObject": _LegacyPlaceholder,
-    "ExportedCCSDocument": _LegacyPlaceholder,
-}
 
-pkg_legacy_document.__dict__.update(_legacy_document_objects)
+def _build_legacy_document(mod: types.ModuleType) -> None:
+    _legacy_document_objects = dict.fromkeys(
+        ("CCSDocumentDescription", "CCSFileInfoObject", "ExportedCCSDocument"),
+        _LegacyPlaceholder,
+    )
+
+    mod.__dict__.update(_legacy_document_objects)
 
-# Expose sub-modules under root for convenience
-pkg_legacy_root.base = pkg_legacy_base  # type: ignore[attr-defined]
-pkg_legacy_root.document = pkg_legacy_document  # type: ignore[attr-defined]
+
+def _build_legacy_root(mod: types.ModuleType) -> None:
+    # Expose sub-modules under root for convenience
+    mod.base = pkg_legacy_base  # type: ignore[attr-defined]
+    mod.document = pkg_legacy_document  # type: ignore[attr-defined]
 
 
 # ---------------------------------------------------------------------------
@@ -149,11 +235,18 @@ pkg_legacy_root.document = pkg_legacy_document  # type: ignore[attr-defined]
 
 pkg_types = _register("docling_core.types")
 
-pkg_types.DoclingDocument = lambda *a, **kw: DoclingDocument(*a, **kw)  # type: ignore[attr-defined]
 
-# Expose *DoclingDocument* at this level for imports like
-# ``from docling_core.types import DoclingDocument`` that appear in the test
-# suite.
+def _build_types(mod: types.ModuleType) -> None:
+    # Expose *DoclingDocument* at this level for imports like
+    # ``from docling_core.types import DoclingDocument`` that appear in the test
+    # suite.
+    mod.DoclingDocument = DoclingDocument  # type: ignore[attr-defined]
+
+    # • Simple alias for ``docling_core.types`` to expose ``doc`` sub-module.
+    mod.doc = mod_doc  # type: ignore[attr-defined]
+
+    # Export in parent package for direct access like ``from docling_core.types.io import DocumentStream``
+    mod.io = mod_io  # type: ignore[attr-defined]
 
 # ~~~~~~~~~~~~~~~~~~~~  Base helper data-structures  ~~~~~~~~~~~~~~~~~~~~~~~~ #
 
@@ -166,13 +259,26 @@ class Size(_Placeholder):
     height: float = 0.0
 
     def __init__(self, width: float = 0.0, height: float = 0.0):
-        super().__init__(width=width, height=height)
+        # Write straight into the instance dict – skips the kwargs round-trip
+        # through ``_Placeholder.__init__``.
+        ns = self.__dict__
+        ns["width"] = width
+        ns["height"] = height
 
 
 # BoundingBox implementation
 
 
 class BoundingBox:  # noqa: D401 – simple geometry helper
+    # Class-level defaults: a coordinate is only stored on the instance when
+    # it differs from zero, so ``BoundingBox()`` performs no attribute writes.
+    # (This rules out ``__slots__`` – a slot cannot share its name with a
+    # class attribute.)
+    l: float = 0.0
+    t: float = 0.0
+    r: float = 0.0
+    b: float = 0.0
+
     def __init__(
         self,
         *,
@@ -182,10 +288,14 @@ class BoundingBox:  # noqa: D401 – simple geometry helper
         b: float = 0.0,
         coord_origin: str | None = None,  # kept for signature compatibility
     ) -> None:
-        self.l = l
-        self.t = t
-        self.r = r
-        self.b = b
+        if l:
+            self.l = l
+        if t:
+            self.t = t
+        if r:
+            self.r = r
+        if b:
+            self.b = b
 
     # Convenience helpers expected by a few call-sites ------------------- #
 
@@ -229,11 +339,9 @@ class BoundingBox:  # noqa: D401 – simple geometry helper
 
     @classmethod  # noqa: D401 – pydantic hook
     def __get_pydantic_core_schema__(cls, _source_type, _handler):  # type: ignore[override]
-        from pydantic_core import core_schema  # local import – lightweight
-
         # Use the catch-all *any* schema so that no further validation or
         # serialisation logic is required.
-        return core_schema.any_schema()
+        return _any_schema()
 
     @classmethod
     def from_tuple(
@@ -250,26 +358,32 @@ class BoundingBox:  # noqa: D401 – simple geometry helper
 # ---------------------------------------------------------------------------
 
 
+# Member values go through ``sys.intern`` so value look-ups such as
+# ``DocItemLabel("text")`` compare interned strings.  Evaluated once, at
+# class creation.
+_L = sys.intern
+
+
 class DocItemLabel(str, Enum):
-    TEXT = "text"
-    TABLE = "table"
-    FORMULA = "formula"
-    PICTURE = "picture"
-
-    TITLE = "title"
-    DOCUMENT_INDEX = "document_index"
-    SECTION_HEADER = "section_header"
-    CHECKBOX_SELECTED = "checkbox_selected"
-    CHECKBOX_UNSELECTED = "checkbox_unselected"
-    CAPTION = "caption"
-    PAGE_HEADER = "page_header"
-    PAGE_FOOTER = "page_footer"
-    FOOTNOTE = "footnote"
-    LIST_ITEM = "list_item"
-    PARAGRAPH = "paragraph"
-    CODE = "code"
-    FORM = "form"
-    KEY_VALUE_REGION = "key_value_region"
+    TEXT = _L("text")
+    TABLE = _L("table")
+    FORMULA = _L("formula")
+    PICTURE = _L("picture")
+
+    TITLE = _L("title")
+    DOCUMENT_INDEX = _L("document_index")
+    SECTION_HEADER = _L("section_header")
+    CHECKBOX_SELECTED = _L("checkbox_selected")
+    CHECKBOX_UNSELECTED = _L("checkbox_unselected")
+    CAPTION = _L("caption")
+    PAGE_HEADER = _L("page_header")
+    PAGE_FOOTER = _L("page_footer")
+    FOOTNOTE = _L("footnote")
+    LIST_ITEM = _L("list_item")
+    PARAGRAPH = _L("paragraph")
+    CODE = _L("code")
+    FORM = _L("form")
+    KEY_VALUE_REGION = _L("key_value_region")
 
 
 # Core document & related classes ---------------------------------------- #
@@ -298,13 +412,6 @@ class TableItem(_Placeholder):
 class TableCell(_Placeholder):
     pass
 
-    # Allow pydantic schema generation when the stub is used as a field type.
-    @classmethod  # noqa: D401 – pydantic v2 private hook
-    def __get_pydantic_core_schema__(cls, _source_type, _handler):  # type: ignore[override]
-        from pydantic_core import core_schema
-
-        return core_schema.any_schema()
-
 
 class TableData(_Placeholder):
     pass
@@ -317,12 +424,6 @@ class SegmentedPdfPage(_Placeholder):
 class TextCell(_Placeholder):
     pass
 
-    @classmethod  # noqa: D401 – pydantic v2 private hook
-    def __get_pydantic_core_schema__(cls, _source_type, _handler):  # type: ignore[override]
-        from pydantic_core import core_schema
-
-        return core_schema.any_schema()
-
 
 class BoundingRectangle(_Placeholder):
     @classmethod
@@ -355,9 +456,32 @@ class DoclingDocument:  # noqa: D401 – very small subset
 
     @classmethod
     def __get_pydantic_core_schema__(cls, _source_type, _handler):  # type: ignore[override]
-        from pydantic_core import core_schema
+        return _any_schema()
+
+
 
-        return core_schema.any_schema()
+
+# Enums exposed through ``docling_core.types.doc`` – built exactly once at
+# module level rather than inline in the public-objects table.
+
+ImageRefMode = Enum(
+    "ImageRefMode",
+    {
+        "PLACEHOLDER": "placeholder",
+        "EMBEDDED": "embedded",
+        "REFERENCED": "referenced",
+        "BASE64": "base64",  # alias used in some contexts
+        "URI": "uri",
+    },
+)
+
+CoordOrigin = Enum(
+    "CoordOrigin",
+    {
+        "TOPLEFT": "top_left",
+        "BOTTOMLEFT": "bottom_left",
+    },
+)
 
 
 # Public API exposure ----------------------------------------------------- #
@@ -365,53 +489,55 @@ class DoclingDocument:  # noqa: D401 – very small subset
 
 mod_doc = _register("docling_core.types.doc")
 
-_public_objects = {
-    "BoundingBox": BoundingBox,
-    "DocItemLabel": DocItemLabel,
-    "Size": Size,
-    "DocItem": DocItem,
-    "NodeItem": NodeItem,
-    "TextItem": TextItem,
-    "PictureItem": PictureItem,
-    "TableItem": TableItem,
-    "TableCell": TableCell,
-    "TableData": TableData,
-    "DoclingDocument": DoclingDocument,
-    "SegmentedPdfPage": SegmentedPdfPage,
-    "TextCell": TextCell,
-    # Newly required symbol for tests that import ListItem
-    "ListItem": _Placeholder,
-    "BoundingRectangle": BoundingRectangle,
-    "ImageRefMode": Enum(
-        "ImageRefMode",
-        {
-            "PLACEHOLDER": "placeholder",
-            "EMBEDDED": "embedded",
-            "REFERENCED": "referenced",
-            "BASE64": "base64",  # alias used in some contexts
-            "URI": "uri",
-        },
-    ),
-
-    # Newly required symbols for the larger test-suite ------------------ #
-    # They are *very* small placeholders – just enough to satisfy imports
-    # and basic attribute access used in the code-base.  No functional
-    # behaviour is implemented because the tests never rely on it.
-    "DocumentOrigin": _Placeholder,
-    "CoordOrigin": Enum(
-        "CoordOrigin",
-        {
-            "TOPLEFT": "top_left",
-            "BOTTOMLEFT": "bottom_left",
-        },
-    ),
-    "PictureDataType": _Placeholder,
-
-    # Newly required by *docling.datamodel.document*
-    "SectionHeaderItem": _Placeholder,
-}
 
-mod_doc.__dict__.update(_public_objects)
+def _build_doc(mod: types.ModuleType) -> None:
+    # Names that are plain ``_Placeholder`` stand-ins share a single value.
+    _public_objects = dict.fromkeys(
+        (
+            # Newly required symbol for tests that import ListItem
+            "ListItem",
+            # Newly required symbols for the larger test-suite ------------ #
+            # They are *very* small placeholders – just enough to satisfy
+            # imports and basic attribute access used in the code-base.  No
+            # functional behaviour is implemented because the tests never
+            # rely on it.
+            "DocumentOrigin",
+            "PictureDataType",
+            # Newly required by *docling.datamodel.document*
+            "SectionHeaderItem",
+        ),
+        _Placeholder,
+    )
+    _public_objects.update({
+        "BoundingBox": BoundingBox,
+        "DocItemLabel": DocItemLabel,
+        "Size": Size,
+        "DocItem": DocItem,
+        "NodeItem": NodeItem,
+        "TextItem": TextItem,
+        "PictureItem": PictureItem,
+        "TableItem": TableItem,
+        "TableCell": TableCell,
+        "TableData": TableData,
+        "DoclingDocument": DoclingDocument,
+        "SegmentedPdfPage": SegmentedPdfPage,
+        "TextCell": TextCell,
+        "BoundingRectangle": BoundingRectangle,
+        "ImageRefMode": ImageRefMode,
+        "CoordOrigin": CoordOrigin,
+        # Re-export for convenience
+        "PictureDescriptionData": PictureDescriptionData,
+        # Keep a convenient reference from the parent ``docling_core.types.doc``
+        # package so that wildcard imports (`from ... import *`) behave
+        # similarly to the real library.
+        "page": mod_doc_page,
+    })
+
+    mod.__dict__.update(_public_objects)
+    # Published only once every export above is in place, so that
+    # ``from ... import *`` sees the complete set.
+    mod.__all__ = tuple(_public_objects)  # type: ignore[attr-defined]
+
 
 # ---------------------------------------------------------------------------
 # Additional placeholders required by back-end helpers
@@ -434,19 +560,19 @@ class PdfPageGeometry(_Placeholder):  # noqa: D401 – opaque placeholder
 
 # ``SegmentedPdfPage`` is already defined above but the back-end accesses it
 # via the nested *page* sub-module path.  We therefore expose *all* required
-# classes through that module as well.
+# classes through that module as well – including ``TextCell`` for imports
+# such as ``from docling_core.types.doc.page import TextCell``.
+
+mod_doc_page = _register("docling_core.types.doc.page")
 
-pkg_types_doc_page = _register("docling_core.types.doc.page")
-pkg_types_doc_page.PdfPageBoundaryType = PdfPageBoundaryType  # type: ignore[attr-defined]
-pkg_types_doc_page.PdfPageGeometry = PdfPageGeometry  # type: ignore[attr-defined]
-pkg_types_doc_page.SegmentedPdfPage = SegmentedPdfPage  # type: ignore[attr-defined]
-# Also ensure BoundingRectangle accessible here
-pkg_types_doc_page.BoundingRectangle = BoundingRectangle  # type: ignore[attr-defined]
 
-# Keep a convenient reference from the parent ``docling_core.types.doc``
-# package so that wildcard imports (`from ... import *`) behave similarly to
-# the real library.
-mod_doc.page = pkg_types_doc_page  # type: ignore[attr-defined]
+def _build_doc_page(mod: types.ModuleType) -> None:
+    mod.PdfPageBoundaryType = PdfPageBoundaryType  # type: ignore[attr-defined]
+    mod.PdfPageGeometry = PdfPageGeometry  # type: ignore[attr-defined]
+    mod.SegmentedPdfPage = SegmentedPdfPage  # type: ignore[attr-defined]
+    mod.BoundingRectangle = BoundingRectangle  # type: ignore[attr-defined]
+    mod.TextCell = TextCell  # type: ignore[attr-defined]
+
 
 # Provide nested sub-module ``docling_core.types.doc.document`` so that imports
 # like ``from docling_core.types.doc.document import PictureDescriptionData``
@@ -458,38 +584,21 @@ class PictureDescriptionData(_Placeholder):  # noqa: D401 – simple container
     text: str = ""
 
 
-mod_doc_document.PictureDescriptionData = PictureDescriptionData  # type: ignore[attr-defined]
-mod_doc_document.DoclingDocument = DoclingDocument  # type: ignore[attr-defined]
-mod_doc_document.ListItem = _Placeholder  # type: ignore[attr-defined]
+def _build_doc_document(mod: types.ModuleType) -> None:
+    mod.PictureDescriptionData = PictureDescriptionData  # type: ignore[attr-defined]
+    mod.DoclingDocument = DoclingDocument  # type: ignore[attr-defined]
+    mod.ListItem = _Placeholder  # type: ignore[attr-defined]
 
-# Re-export for convenience
-mod_doc.PictureDescriptionData = PictureDescriptionData  # type: ignore[attr-defined]
-mod_doc.ListItem = _Placeholder  # type: ignore[attr-defined]
 
 # Stub ``DocumentStream`` at top level as it is imported by server code.
 pkg_root.DocumentStream = _Placeholder  # type: ignore[attr-defined]
 
-# The following *blank* sub-modules are added to satisfy imports such as
-# ``from docling_core.types.doc.page import TextCell``.
-
-
-# Reuse the already registered *page* sub-module created earlier so that we
-# do *not* lose previously attached attributes such as ``PdfPageBoundaryType``.
-
-mod_doc_page = sys.modules.get("docling_core.types.doc.page")
+mod_doc_labels = _register("docling_core.types.doc.labels")
 
-if mod_doc_page is None:
-    mod_doc_page = _register("docling_core.types.doc.page")
-mod_doc_page.TextCell = TextCell  # type: ignore[attr-defined]
-mod_doc_page.SegmentedPdfPage = SegmentedPdfPage  # type: ignore[attr-defined]
-if not hasattr(mod_doc_page, "BoundingRectangle"):
-    mod_doc_page.BoundingRectangle = BoundingRectangle  # type: ignore[attr-defined]
 
-mod_doc_labels = _register("docling_core.types.doc.labels")
-mod_doc_labels.DocItemLabel = DocItemLabel  # type: ignore[attr-defined]
+def _build_doc_labels(mod: types.ModuleType) -> None:
+    mod.DocItemLabel = DocItemLabel  # type: ignore[attr-defined]
 
-# • Simple alias for ``docling_core.types`` to expose ``doc`` sub-module.
-pkg_types.doc = mod_doc  # type: ignore[attr-defined]
 
 # ---------------------------------------------------------------------------
 # Additional stubs for ``docling_core.types.io`` to satisfy imports
@@ -502,10 +611,35 @@ class DocumentStream(_Placeholder):
     """Very small placeholder for the I/O streaming abstraction."""
 
 
-mod_io.DocumentStream = DocumentStream  # type: ignore[attr-defined]
+def _build_io(mod: types.ModuleType) -> None:
+    mod.DocumentStream = DocumentStream  # type: ignore[attr-defined]
+
+
+# ---------------------------------------------------------------------------
+# Wire every registered shell to its builder.  Nothing is populated here –
+# the builders run on first attribute access via the PEP 562 hook above.
+# ---------------------------------------------------------------------------
+
+_LAZY = {
+    "docling_core.utils": _build_utils,
+    "docling_core.utils.file": _build_utils_file,
+    "docling_core.utils.legacy": _build_utils_legacy,
+    "docling_core.types.legacy_doc": _build_legacy_root,
+    "docling_core.types.legacy_doc.base": _build_legacy_base,
+    "docling_core.types.legacy_doc.document": _build_legacy_document,
+    "docling_core.types": _build_types,
+    "docling_core.types.doc": _build_doc,
+    "docling_core.types.doc.page": _build_doc_page,
+    "docling_core.types.doc.document": _build_doc_document,
+    "docling_core.types.doc.labels": _build_doc_labels,
+    "docling_core.types.io": _build_io,
+}
+
+_modules = sys.modules
+for _path, _builder in _LAZY.items():
+    _install_lazy(_modules[_path], _builder)
 
-# Export in parent package for direct access like ``from docling_core.types.io import DocumentStream``
-pkg_types.io = mod_io  # type: ignore[attr-defined]
+del _modules, _path, _builder
 
 # ---------------------------------------------------------------------------
 # The stubs above are *minimal* and intentionally incomplete.  They are **not**
@@ -23,7 +23,10 @@ from __future__ import annotations
 
 import sys as _sys
 import types as _types
-from typing import Any, Callable
+from typing import Any
+
+from _stub_common import IDENTITY as _identity
+from _stub_common import NOOP_DECORATOR as _identity_decorator
 
 
 # ---------------------------------------------------------------------------
@@ -45,13 +48,11 @@ class FastAPI:  # noqa: D401 – dummy constructor / attribute bag
         return None
 
     # ``get`` / ``post`` decorators are used but never executed – they only
-    # need to return a decorator that leaves the function untouched.
+    # need to return a decorator that leaves the function untouched.  The
+    # same module-level identity decorator is handed out for every route.
     @staticmethod
     def _route_decorator(*_d_args: Any, **_d_kwargs: Any):  # noqa: D401
-        def wrapper(func: Callable[..., Any]):
-            return func
-
-        return wrapper
+        return _identity_decorator
 
     get = post = websocket = _route_decorator  # type: ignore[assignment]
 
@@ -81,9 +82,18 @@ class WebSocketDisconnect(Exception):  # noqa: D401
     pass
 
 
-# Dependency & parameter helpers
-Depends = lambda dependency=None: dependency  # type: ignore[invalid-name]
-Query = lambda *args, **kwargs: None  # type: ignore[invalid-name]
+# Dependency & parameter helpers – plain module-level functions shared by all
+# call-sites instead of per-name lambdas.
+def _depends(dependency=None):  # noqa: D401 – returns the dependency as-is
+    return dependency
+
+
+def _noop(*_args: Any, **_kwargs: Any):  # noqa: D401 – parameter placeholder
+    return None
+
+
+Depends = _depends
+Query = _noop
 
 
 # ---------------------------------------------------------------------------
@@ -91,13 +101,6 @@ Query = lambda *args, **kwargs: None  # type: ignore[invalid-name]
 # ---------------------------------------------------------------------------
 
 
-def _install_submodule(name: str, obj_name: str, obj):  # noqa: D401 – helper
-    mod = _types.ModuleType(name)
-    setattr(mod, obj_name, obj)  # type: ignore[attr-defined]
-    _sys.modules[name] = mod
-    return mod
-
-
 # fastapi.middleware.cors --------------------------------------------------- #
 
 
@@ -106,10 +109,6 @@ class CORSMiddleware:  # noqa: D401 – inert middleware placeholder
         pass
 
 
-_install_submodule("fastapi.middleware", "cors", _types.ModuleType("cors"))
-_install_submodule("fastapi.middleware.cors", "CORSMiddleware", CORSMiddleware)
-
-
 # fastapi.responses -------------------------------------------------------- #
 
 
@@ -119,9 +118,6 @@ class RedirectResponse:  # noqa: D401 – trivial response container
         self.kwargs = kwargs
 
 
-_install_submodule("fastapi.responses", "RedirectResponse", RedirectResponse)
-
-
 # fastapi.staticfiles ------------------------------------------------------ #
 
 
@@ -131,26 +127,46 @@ class StaticFiles:  # noqa: D401 – inert wrapper
         self.kwargs = kwargs
 
 
-_install_submodule("fastapi.staticfiles", "StaticFiles", StaticFiles)
-
-
 # fastapi.openapi.docs ----------------------------------------------------- #
-
-
-def _identity(*args: Any, **kwargs: Any):  # noqa: D401 – helper returning None
-    return None
-
-
-docs_mod = _types.ModuleType("fastapi.openapi.docs")
-docs_mod.get_redoc_html = _identity  # type: ignore[attr-defined]
-docs_mod.get_swagger_ui_html = _identity  # type: ignore[attr-defined]
-docs_mod.get_swagger_ui_oauth2_redirect_html = _identity  # type: ignore[attr-defined]
-_sys.modules["fastapi.openapi.docs"] = docs_mod
-
-# Create parent packages so that ``from fastapi.openapi.docs import ...`` works
-openapi_mod = _types.ModuleType("fastapi.openapi")
-openapi_mod.docs = docs_mod  # type: ignore[attr-defined]
-_sys.modules["fastapi.openapi"] = openapi_mod
+# The ``get_*_html`` helpers resolve to the shared ``_identity`` (see below).
+
+
+# Every sub-module is an instance of one shared module class that resolves
+# attributes on demand: registered child modules first (``fastapi.openapi``
+# → ``.docs``), then the concrete placeholders above, and ``_identity`` for
+# anything else – e.g. the ``get_*_html`` helpers of *fastapi.openapi.docs*.
+# Dunder look-ups (``__path__``, ``__all__``, ``__wrapped__`` …) keep raising
+# ``AttributeError`` so the import machinery and introspection behave.
+
+_STUB_ATTRS = {
+    "CORSMiddleware": CORSMiddleware,
+    "RedirectResponse": RedirectResponse,
+    "StaticFiles": StaticFiles,
+}
+
+
+class _StubModule(_types.ModuleType):  # noqa: D401 – any-attribute module
+    def __getattr__(self, name: str, _modules=_sys.modules):
+        if name[:2] == "__":
+            raise AttributeError(name)
+        child = _modules.get(f"{self.__name__}.{name}")
+        if child is not None:
+            return child
+        return _STUB_ATTRS.get(name, _identity)
+
+
+_modules = _sys.modules
+for _path in (
+    "fastapi.middleware",
+    "fastapi.middleware.cors",
+    "fastapi.responses",
+    "fastapi.staticfiles",
+    "fastapi.openapi",
+    "fastapi.openapi.docs",
+):
+    _modules[_path] = _StubModule(_path)
+
+del _modules, _path
 
 
 # ---------------------------------------------------------------------------
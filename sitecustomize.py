@@ -20,8 +20,10 @@ same spirit.
 
 from __future__ import annotations
 
-import asyncio
+import functools
+import importlib.util
 import inspect
+import os
 import sys
 import types
 from pathlib import Path
@@ -40,168 +42,177 @@ from typing import Any, Callable, Generator
 # path.
 
 _PROJECT_ROOT = Path(__file__).resolve().parent
-_SRC_PATH = str(_PROJECT_ROOT / "src")
 
-if _SRC_PATH not in sys.path:
-    sys.path.insert(0, _SRC_PATH)
+# Whether a full local ``pytest_asyncio.py`` ships next to this file – probed
+# once (a single ``stat``) and reused by the stub installation below.
+_HAS_LOCAL_PA = (_PROJECT_ROOT / "pytest_asyncio.py").is_file()
 
 # Additionally keep backward-compatibility with any code that might rely on
 # the older *editable* installation behaviour (inserting the package root
 # directly) by adding the namespace folders as fallbacks.
-for _rel in ("src/docling", "src/docling-serve"):
-    _pth = str(_PROJECT_ROOT / _rel)
-    if _pth not in sys.path:
-        sys.path.insert(0, _pth)
-
-# ---------------------------------------------------------------------------
+#
 # Ensure repository root is on *sys.path* so that helper stubs located next to
 # this *sitecustomize.py* file (e.g. *pytest_asyncio.py*) are importable even
 # when *pytest* changes the working directory to a nested package such as
 # *src/docling-serve*.  Relying on the default empty-string entry (".") is not
 # sufficient because *pytest* overwrites the CWD during collection which would
-# otherwise make the stubs undiscoverable.
-# ---------------------------------------------------------------------------
+# otherwise make the stubs undiscoverable.  The root is inserted last so that
+# it ends up *first* – locally bundled fallbacks take precedence over any
+# third-party libraries present in the broader environment.
+#
+# Membership is checked against a one-off ``set`` snapshot rather than by
+# scanning the (potentially long) ``sys.path`` list once per candidate.
+
+# Relative to the project root, in insertion order ("" is the root itself).
+_PATH_ENTRIES = ("src", "src/docling", "src/docling-serve", "")
+
+_sys_path = sys.path
+_existing = set(_sys_path)
+for _rel in _PATH_ENTRIES:
+    _pth = str(_PROJECT_ROOT / _rel)
+    if _pth not in _existing:
+        _sys_path.insert(0, _pth)
+        _existing.add(_pth)
 
-_ROOT_STR = str(_PROJECT_ROOT)
-if _ROOT_STR not in sys.path:
-    # Prepend so that locally bundled fallbacks take precedence over any
-    # third-party libraries present in the broader environment.
-    sys.path.insert(0, _ROOT_STR)
+del _sys_path, _existing, _rel, _pth
 
 # ---------------------------------------------------------------------------
-# ``pytest_asyncio`` *minimal* stub ------------------------------------------------
-# Skip stub installation when a full local implementation exists.
+# Everything below the path set-up only serves the test-suite.  Since this
+# module runs on *every* interpreter start-up, the stub installation is
+# skipped unless pytest is actually in play: already imported, running a test
+# in a parent process (``PYTEST_CURRENT_TEST`` is inherited by subprocesses)
+# or launched directly.  The launcher check compares the basename of
+# ``argv[0]`` against a fixed set instead of substring-scanning arguments.
+# ``sys.argv`` is incomplete this early for ``python -m pytest`` – it reads
+# ``["-m", ...]`` – so the module name is taken from ``sys.orig_argv``, where
+# it sits right before the arguments that ``sys.argv`` retains.
 # ---------------------------------------------------------------------------
 
-from pathlib import Path
-
-if not (Path(__file__).with_name("pytest_asyncio.py").exists()):
-    import types, inspect, asyncio
-
-    _pytest_asyncio_mod = types.ModuleType("pytest_asyncio")
-
-# Placeholder until real pytest is imported
-def _noop_fixture(*args: Any, **kwargs: Any):  # noqa: D401
-    def decorator(func: Callable[..., Any]):
-        return func
-
-    return decorator
-
-
-_pytest_asyncio_mod.fixture = _noop_fixture  # type: ignore[attr-defined]
-
-
-# Dummy marker attribute so that @pytest.mark.asyncio does not fail when the
-# real plugin is absent.  The actual mark object is provided later once
-# *pytest* is available.
-_pytest_asyncio_mod.asyncio = True  # type: ignore[attr-defined]
-
-# Register early so that `import pytest_asyncio` succeeds during test collection.
-sys.modules["pytest_asyncio"] = _pytest_asyncio_mod
-
-# After pytest is imported we upgrade the stub so that coroutine tests &
-# fixtures are auto-run via ``asyncio.run``.  The upgrading is performed lazily
-# inside a small post-import hook.
-
+_PYTEST_LAUNCHERS = frozenset({"pytest", "py.test", "pytest.exe", "py.test.exe"})
 
-def _upgrade_pytest_asyncio_stub(original_mod):  # noqa: D401 – internal helper
-    import pytest  # local import – guaranteed to succeed at this point
+_argv = sys.argv
+if _argv and _argv[0] == "-m":
+    _orig_argv = getattr(sys, "orig_argv", ())
+    _argv0 = _orig_argv[-len(_argv)] if len(_orig_argv) > len(_argv) else ""
+else:
+    _argv0 = os.path.basename(_argv[0]) if _argv else ""
+_IS_PYTEST = _argv0 in _PYTEST_LAUNCHERS or _argv0.startswith("pytest")
 
-    def fixture(*f_args: Any, **f_kwargs: Any):  # noqa: D401 – mimic original call styles
-        """Replacement for @pytest_asyncio.fixture supporting both call styles."""
+_UNDER_PYTEST = bool(
+    _IS_PYTEST
+    or os.environ.get("PYTEST_CURRENT_TEST")
+    or "pytest" in sys.modules
+)
 
-        def _create_fixture(func: Callable[..., Any]):  # noqa: D401 – inner helper
-            if inspect.iscoroutinefunction(func):
-
-                def _sync_wrapper(*args: Any, **kwargs: Any):  # noqa: D401
-                    return asyncio.run(func(*args, **kwargs))
+# ---------------------------------------------------------------------------
+# Shared event loop – every async fixture and coroutine test runs on one
+# persistent loop instead of paying ``asyncio.run``'s loop construction and
+# teardown per call.  It also keeps async generators (fixture set-up and
+# teardown) on the loop they were started on.  The loop is owned by
+# ``_stub_common`` so that *conftest.py* runs its tests on the very same one.
+# ---------------------------------------------------------------------------
 
-                return pytest.fixture(*remaining_args, **f_kwargs)(_sync_wrapper)
+from _stub_common import get_loop as _get_loop  # noqa: E402
 
-            if inspect.isasyncgenfunction(func):
 
-                def _sync_gen_wrapper(*args: Any, **kwargs: Any):  # noqa: D401
-                    agen = func(*args, **kwargs)
-                    try:
-                        value = asyncio.run(agen.__anext__())
-                        yield value
-                    finally:
-                        try:
-                            asyncio.run(agen.__anext__())
-                        except StopAsyncIteration:
-                            pass
+# ---------------------------------------------------------------------------
+# ``pytest_asyncio`` *minimal* stub ------------------------------------------------
+# Skip stub installation when a full local implementation exists.
+# ---------------------------------------------------------------------------
 
-                return pytest.fixture(*remaining_args, **f_kwargs)(_sync_gen_wrapper)
 
-            return pytest.fixture(*remaining_args, **f_kwargs)(func)
+# Plugin hooks of the stub.  They only rely on the objects pytest passes in,
+# never on the ``pytest`` module, so the lazy stub can carry them from the
+# start.
 
-        # Detect direct decorator usage vs. decorator factory usage ------------
-        if f_args and callable(f_args[0]):
-            func = f_args[0]
-            remaining_args = f_args[1:]
-            return _create_fixture(func)
 
-        remaining_args = f_args  # passed to pytest.fixture later
+def _pytest_configure(config) -> None:  # noqa: D401 – pytest hook
+    # Registering the marker keeps ``@pytest.mark.asyncio`` a *known* mark –
+    # no ``PytestUnknownMarkWarning`` and no failure under ``--strict-markers``.
+    config.addinivalue_line(
+        "markers", "asyncio: run the coroutine test on the shared event loop"
+    )
 
-        def decorator(func: Callable[..., Any]):  # noqa: D401 – closure
-            return _create_fixture(func)
 
-        return decorator
+def _pytest_pyfunc_call(pyfuncitem):  # noqa: D401 – pytest hook
+    test_obj = pyfuncitem.obj
 
-    original_mod.fixture = fixture  # type: ignore[attr-defined]
-    # Pytest hook to execute async test functions automatically.
-    def pytest_pyfunc_call(pyfuncitem):  # type: ignore[override]
-        test_obj = pyfuncitem.obj
-        if inspect.iscoroutinefunction(test_obj):
-            kwargs = {
-                name: pyfuncitem.funcargs[name]
-                for name in pyfuncitem._fixtureinfo.argnames  # type: ignore[attr-defined]
-            }
-            asyncio.run(test_obj(**kwargs))
-            return True
+    if not inspect.iscoroutinefunction(test_obj):
         return None
 
-    original_mod.pytest_pyfunc_call = pytest_pyfunc_call  # type: ignore[attr-defined]
-
-    # Provide marker pass-through after pytest is available.
-    if not hasattr(pytest.mark, "asyncio"):
-        pytest.mark.asyncio = pytest.mark  # type: ignore[attr-defined]
-
-    # Ensure the stub is registered as a plugin so that the hook is executed.
-    try:
-        pm = pytest.config.pluginmanager  # type: ignore[attr-defined]
-    except Exception:
-        pm = getattr(pytest, "pluginmanager", None)
+    # Resolve the attribute chains once rather than per fixture name.
+    names = pyfuncitem._fixtureinfo.argnames  # type: ignore[attr-defined]
+    funcargs = pyfuncitem.funcargs
+    kwargs = {name: funcargs[name] for name in names} if names else {}
+    _get_loop().run_until_complete(test_obj(**kwargs))
+    return True  # indicate we consumed the call
+
+
+class _LazyPytestAsyncio(types.ModuleType):  # noqa: D401 – self-upgrading stub
+    """``pytest_asyncio`` stand-in that upgrades itself once pytest is loaded.
+
+    The upgrade is triggered by the first attribute *miss* after ``pytest``
+    shows up in ``sys.modules`` – e.g. when a test module resolves
+    ``fixture``.  Until
+    then ``fixture`` resolves to the no-op placeholder below.  No import hook
+    of any kind (``sys.meta_path``, ``sys.path_hooks`` or audit hooks) is
+    involved.
+    """
+
+    def __getattr__(self, name: str):
+        if "pytest" in sys.modules:
+            # One-shot hook: demote to a plain module *before* upgrading so
+            # that every later miss is an ordinary C-level AttributeError.
+            self.__class__ = types.ModuleType
+            _install_pytest_asyncio_stub(self)
+            return getattr(self, name)
+        if name == "fixture":
+            return _noop_fixture
+        raise AttributeError(name)
 
-    if pm and not pm.has_plugin("pytest_asyncio"):
-        pm.register(original_mod, "pytest_asyncio")
 
+# Placeholder until real pytest is imported
+def _noop_fixture(*args: Any, **kwargs: Any):  # noqa: D401
+    def decorator(func: Callable[..., Any]):
+        return func
 
-# Register a meta path finder that upgrades the stub once pytest is imported.
-
-class _PytestImportHook:
-    def find_spec(self, fullname, path, target=None):  # noqa: D401
-        if fullname != "pytest":
-            return None
-
-        import importlib.machinery
-
-        spec = importlib.machinery.PathFinder.find_spec(fullname, path)
+    return decorator
 
-        if spec and spec.loader:
 
-            orig_exec = spec.loader.exec_module  # type: ignore[attr-defined]
+# The stub is only installed when no ``pytest_asyncio`` exists on disk at all –
+# neither the real plugin nor a local implementation next to this file – so
+# it never shadows one.  The ``stat`` above settles the local case before the
+# ``sys.path`` walk of ``find_spec``.
+_NEEDS_PA_STUB = (
+    _UNDER_PYTEST
+    and not _HAS_LOCAL_PA
+    and importlib.util.find_spec("pytest_asyncio") is None
+)
 
-            def exec_module_override(loader_self, module):  # type: ignore[no-self-arg]
-                orig_exec(module)
-                _upgrade_pytest_asyncio_stub(_pytest_asyncio_mod)
+if _NEEDS_PA_STUB:
+    _pytest_asyncio_mod = _LazyPytestAsyncio("pytest_asyncio")
 
-            spec.loader.exec_module = exec_module_override  # type: ignore[attr-defined]
+    # Dummy marker attribute so that @pytest.mark.asyncio does not fail when
+    # the real plugin is absent.  The actual mark object is provided later
+    # once *pytest* is available.
+    _pytest_asyncio_mod.asyncio = True  # type: ignore[attr-defined]
 
-        return spec
+    # The hooks do not need pytest itself, so they are in place before the
+    # plugin manager first looks at the module.  pytest offers no global
+    # plugin manager to register with from here – the repository *conftest.py*
+    # registers the stub through ``config.pluginmanager`` instead.
+    _pytest_asyncio_mod.pytest_configure = _pytest_configure  # type: ignore[attr-defined]
+    _pytest_asyncio_mod.pytest_pyfunc_call = _pytest_pyfunc_call  # type: ignore[attr-defined]
 
+    # Register early so that `import pytest_asyncio` succeeds during test
+    # collection.
+    sys.modules["pytest_asyncio"] = _pytest_asyncio_mod
 
-sys.meta_path.insert(0, _PytestImportHook())
+# After pytest is imported we upgrade the stub so that coroutine tests &
+# fixtures are auto-run on the shared loop.  The upgrading is performed lazily
+# by ``_LazyPytestAsyncio.__getattr__`` – a one-off check on attribute access
+# instead of a ``sys.meta_path`` finder consulted on *every* import – which
+# hands the module to ``_install_pytest_asyncio_stub`` below.
 
 
 # ---------------------------------------------------------------------------
@@ -209,86 +220,88 @@ sys.meta_path.insert(0, _PytestImportHook())
 # ---------------------------------------------------------------------------
 
 
-def _install_pytest_asyncio_stub() -> None:  # noqa: D401 – internal helper
-    # Skip when a standalone pytest_asyncio.py implementation is present.
-    if "pytest_asyncio" in sys.modules and hasattr(sys.modules["pytest_asyncio"], "fixture"):
-        return
+def _drive_async_gen(
+    func: Callable[..., Any], args: tuple, kwargs: dict
+) -> Generator[Any, None, None]:  # noqa: D401 – internal helper
+    """Run async-generator fixture *func* on the shared loop as a sync generator.
+
+    Set-up and teardown share one loop lookup.  Teardown resumes the generator
+    rather than ``aclose()``-ing it – code after a bare ``yield`` would
+    otherwise never run – and only closes it if it unexpectedly yields again.
+    """
 
+    loop = _get_loop()
+    agen = func(*args, **kwargs)
     try:
-        import pytest  # local import – only when pytest present
-    except ModuleNotFoundError:
-        return
+        yield loop.run_until_complete(agen.__anext__())
+    finally:
+        try:
+            loop.run_until_complete(agen.__anext__())
+        except StopAsyncIteration:
+            pass
+        else:
+            loop.run_until_complete(agen.aclose())
 
-    import types
 
-    mod = types.ModuleType("pytest_asyncio")
+def _install_pytest_asyncio_stub(mod: types.ModuleType) -> None:  # noqa: D401 – internal helper
+    """Populate the lazy stub *mod* with the pytest-backed ``fixture`` decorator.
 
-    # ------------------------------ Fixtures ------------------------------ #
+    Called by ``_LazyPytestAsyncio.__getattr__`` once pytest has been
+    imported; the plugin hooks are attached when the stub is created.
+    """
 
-    def _fixture(*fixture_args: Any, **fixture_kwargs: Any):  # type: ignore[override]
-        """Replacement for @pytest_asyncio.fixture.
+    pytest = sys.modules["pytest"]
 
-        Wraps an *async* fixture so that the coroutine / async-generator is
-        executed inside a dedicated event-loop at collection time and the
-        yielded value is returned to the synchronous *pytest* context.
-        """
+    # ------------------------------ Fixtures ------------------------------ #
+
+    # The decorator closure only depends on the ``pytest.fixture`` arguments,
+    # and suites use a handful of shapes (bare, ``scope="module"`` …) – so it
+    # is built once per shape and shared.
+    @functools.lru_cache(maxsize=32)
+    def _make_decorator(fixture_args: tuple, fixture_kwargs_items: tuple):  # noqa: D401
+        fixture_kwargs = dict(fixture_kwargs_items)
 
         def decorator(func: Callable[..., Any]):  # noqa: D401 – inner helper
             if inspect.iscoroutinefunction(func):
 
-                def _sync_wrapper(*args: Any, **kwargs: Any):  # noqa: D401
-                    return asyncio.run(func(*args, **kwargs))
-
-                return pytest.fixture(*fixture_args, **fixture_kwargs)(_sync_wrapper)
+                def wrapper(*args: Any, **kwargs: Any):  # noqa: D401
+                    return _get_loop().run_until_complete(func(*args, **kwargs))
 
             elif inspect.isasyncgenfunction(func):
 
-                def _sync_gen_wrapper(*args: Any, **kwargs: Any):  # noqa: D401
-                    agen = func(*args, **kwargs)
-                    try:
-                        value = asyncio.run(agen.__anext__())
-                        yield value
-                    finally:
-                        try:
-                            asyncio.run(agen.__anext__())
-                        except StopAsyncIteration:
-                            pass
-
-                return pytest.fixture(*fixture_args, **fixture_kwargs)(_sync_gen_wrapper)
-
-            # Non-async fixtures are forwarded unchanged
-            return pytest.fixture(*fixture_args, **fixture_kwargs)(func)
-
-        return decorator if fixture_args or fixture_kwargs else decorator
-
-    mod.fixture = _fixture  # type: ignore[attr-defined]
+                def wrapper(*args: Any, **kwargs: Any):  # noqa: D401
+                    return (yield from _drive_async_gen(func, args, kwargs))
 
-    # --------------------------- pytest hooks ----------------------------- #
+            else:
+                # Non-async fixtures are forwarded unchanged
+                return pytest.fixture(*fixture_args, **fixture_kwargs)(func)
 
-    def pytest_pyfunc_call(pyfuncitem):  # type: ignore[override]
-        test_obj = pyfuncitem.obj
+            return pytest.fixture(*fixture_args, **fixture_kwargs)(
+                functools.wraps(func)(wrapper)
+            )
 
-        if inspect.iscoroutinefunction(test_obj):
-            kwargs = {name: pyfuncitem.funcargs[name] for name in pyfuncitem._fixtureinfo.argnames}  # type: ignore[attr-defined]
-            asyncio.run(test_obj(**kwargs))
-            return True  # indicate we consumed the call
-
-        return None
+        return decorator
 
-    mod.pytest_pyfunc_call = pytest_pyfunc_call  # type: ignore[attr-defined]
+    def _fixture(*fixture_args: Any, **fixture_kwargs: Any):  # type: ignore[override]
+        """Replacement for @pytest_asyncio.fixture supporting both call styles.
 
-    # -------------------------- Marker support --------------------------- #
+        Wraps an *async* fixture so that the coroutine / async-generator is
+        executed on the shared event-loop and the yielded value is returned to
+        the synchronous *pytest* context.
+        """
 
-    # Provide a no-op marker so that ``@pytest.mark.asyncio`` does not error
-    # when the real plugin is absent.
-    if not hasattr(pytest.mark, "asyncio"):
-        pytest.mark.asyncio = pytest.mark  # type: ignore[attr-defined]
+        # Bare ``@pytest_asyncio.fixture`` passes the function itself.
+        if len(fixture_args) == 1 and not fixture_kwargs and callable(fixture_args[0]):
+            return _make_decorator((), ())(fixture_args[0])
 
-    # Finally register the stub as a plugin so that the hook is discovered.
-    sys.modules["pytest_asyncio"] = mod
+        key = (fixture_args, tuple(sorted(fixture_kwargs.items())))
+        try:
+            return _make_decorator(*key)
+        except TypeError:  # unhashable arguments, e.g. ``params=[...]``
+            return _make_decorator.__wrapped__(*key)
 
+    mod.fixture = _fixture  # type: ignore[attr-defined]
 
-_install_pytest_asyncio_stub()
 
 # ---------------------------------------------------------------------------
 # Additional lightweight stubs so that the bundled test-suite can run without
@@ -300,7 +313,16 @@ _install_pytest_asyncio_stub()
 # ---------------------------------------------------------------------------
 
 
-import types as _types
+def _make_stub(name: str, /, **attrs: Any) -> types.ModuleType:  # noqa: D401 – factory
+    """Return a new module *name* pre-populated with *attrs*.
+
+    Registration is left to the caller so that sub-module chains can be added
+    to ``sys.modules`` in one go.
+    """
+
+    mod = types.ModuleType(name)
+    mod.__dict__.update(attrs)
+    return mod
 
 
 # ---------------------------------------------------------------------------
@@ -314,7 +336,8 @@ import types as _types
 
 
 def _install_pytest_check_stub() -> None:  # noqa: D401 – internal helper
-    if "pytest_check" in sys.modules:
+    modules = sys.modules
+    if "pytest_check" in modules:
         return  # real library (or another stub) already present
 
     class _CheckProxy:  # noqa: D401 – minimal proxy object
@@ -328,9 +351,7 @@ def _install_pytest_check_stub() -> None:  # noqa: D401 – internal helper
         def equal(a, b, msg: str | None = None):  # noqa: D401
             assert a == b, msg or f"Expected {a!r} == {b!r}"
 
-    _mod = _types.ModuleType("pytest_check")
-    _mod.check = _CheckProxy()  # type: ignore[attr-defined]
-    sys.modules["pytest_check"] = _mod
+    modules["pytest_check"] = _make_stub("pytest_check", check=_CheckProxy())
 
 
 # ---------------------------------------------------------------------------
@@ -342,7 +363,8 @@ def _install_pytest_check_stub() -> None:  # noqa: D401 – internal helper
 
 
 def _install_asgi_lifespan_stub() -> None:  # noqa: D401 – internal helper
-    if "asgi_lifespan" in sys.modules:
+    modules = sys.modules
+    if "asgi_lifespan" in modules:
         return
 
     class LifespanManager:  # noqa: D401 – minimal stub
@@ -355,9 +377,7 @@ def _install_asgi_lifespan_stub() -> None:  # noqa: D401 – internal helper
         async def __aexit__(self, exc_type, exc, tb):  # noqa: D401
             return False  # propagate exceptions
 
-    _mod = _types.ModuleType("asgi_lifespan")
-    _mod.LifespanManager = LifespanManager  # type: ignore[attr-defined]
-    sys.modules["asgi_lifespan"] = _mod
+    modules["asgi_lifespan"] = _make_stub("asgi_lifespan", LifespanManager=LifespanManager)
 
 
 # ---------------------------------------------------------------------------
@@ -370,10 +390,19 @@ def _install_asgi_lifespan_stub() -> None:  # noqa: D401 – internal helper
 
 
 def _install_websockets_stub() -> None:  # noqa: D401 – internal helper
-    if "websockets" in sys.modules:
+    modules = sys.modules
+    if "websockets" in modules:
         return
 
-    def _connect(*args, **kwargs):  # noqa: D401 – signature compatibility
+    # The module chain itself has to be registered up-front: ``import
+    # websockets.sync.client`` resolves sub-modules through ``sys.modules`` and
+    # the parent's ``__path__``, never through a module-level ``__getattr__``.
+    # What *can* wait is the client implementation – it is only built, via
+    # PEP 562, the first time ``connect`` is looked up.
+    def _client_getattr(name: str):  # noqa: D401 – PEP 562 hook
+        if name != "connect":
+            raise AttributeError(f"module 'websockets.sync.client' has no attribute {name!r}")
+
         class _DummyWebSocket:  # noqa: D401 – minimal iterator / context-manager
             def __enter__(self):
                 return self
@@ -387,18 +416,17 @@ def _install_websockets_stub() -> None:  # noqa: D401 – internal helper
             def __next__(self):  # pragma: no cover – iterator protocol
                 raise StopIteration
 
-        return _DummyWebSocket()
-
-    _client_mod = _types.ModuleType("websockets.sync.client")
-    _client_mod.connect = _connect  # type: ignore[attr-defined]
+        def connect(*args, **kwargs):  # noqa: D401 – signature compatibility
+            return _DummyWebSocket()
 
-    _sync_mod = _types.ModuleType("websockets.sync")
-    _sync_mod.client = _client_mod  # type: ignore[attr-defined]
+        _client_mod.connect = connect  # type: ignore[attr-defined]
+        return connect
 
-    _ws_mod = _types.ModuleType("websockets")
-    _ws_mod.sync = _sync_mod  # type: ignore[attr-defined]
+    _client_mod = _make_stub("websockets.sync.client", __getattr__=_client_getattr)
+    _sync_mod = _make_stub("websockets.sync", client=_client_mod)
+    _ws_mod = _make_stub("websockets", sync=_sync_mod)
 
-    sys.modules.update(
+    modules.update(
         {
             "websockets": _ws_mod,
             "websockets.sync": _sync_mod,
@@ -418,52 +446,143 @@ def _install_websockets_stub() -> None:  # noqa: D401 – internal helper
 # ---------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=None)
+def _has_module(name: str) -> bool:  # noqa: D401 – internal helper
+    """Cheap, memoised existence probe – no module code is executed.
+
+    ``find_spec`` on a dotted name imports the parent and raises when that is
+    missing, hence the parent is probed first.  Negative answers are cached
+    too, so an absent package costs a single ``sys.path`` walk.
+    """
+
+    if name in sys.modules:
+        return True
+    parent = name.rpartition(".")[0]
+    if parent and not _has_module(parent):
+        return False
+    return importlib.util.find_spec(name) is not None
+
+
+class _ForgetOnFailure:  # noqa: D401 – loader wrapper
+    """Delegate to *loader*, unregistering the module if its body fails.
+
+    ``LazyLoader`` runs the module body on first attribute access, long after
+    the module was registered (and aliased).  A sub-package whose own imports
+    fail – e.g. a missing heavy dependency – would otherwise stay behind
+    half-executed under every name and answer later look-ups with misleading
+    ``AttributeError``s.  Forgetting it restores the regular import
+    semantics: the error surfaces once and later imports fail cleanly.
+    """
+
+    def __init__(self, loader):
+        self._loader = loader
+
+    def __getattr__(self, name: str):  # resource readers, ``get_code`` …
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):  # noqa: D401
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):  # noqa: D401
+        try:
+            self._loader.exec_module(module)
+        except BaseException:
+            modules = sys.modules
+            for key in [k for k, v in modules.items() if v is module]:
+                del modules[key]
+                parent, _, child = key.rpartition(".")
+                parent_ns = vars(modules[parent]) if parent in modules else {}
+                if parent_ns.get(child) is module:
+                    del parent_ns[child]
+            raise
+
+
+def _lazy_import(name: str):  # noqa: D401 – internal helper
+    """Register *name* behind a ``LazyLoader`` and return the module.
+
+    The module body only executes on first attribute access, so aliasing a
+    sub-package no longer imports it.  Returns ``None`` when it is missing.
+    """
+
+    if not _has_module(name):
+        return None
+
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        return None
+
+    loader = importlib.util.LazyLoader(_ForgetOnFailure(spec.loader))
+    spec.loader = loader
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[name] = mod
+    loader.exec_module(mod)  # defers the real work
+
+    # Mirror the regular import machinery: bind the child on its parent.
+    parent, _, child = name.rpartition(".")
+    setattr(sys.modules[parent], child, mod)
+    return mod
+
+
+# First-level sub-packages we want to alias.  Extend as required.
+_SUBPACKAGES = (
+    "datamodel",
+    "models",
+    "backend",
+    "chunking",
+    "pipeline",
+    "exceptions",
+    "utils",
+)
+
+
 def _install_docling_forwarders() -> None:  # noqa: D401 – internal helper
-    try:
-        import importlib
+    modules = sys.modules
+
+    # Bail out before touching the import machinery when the implementation
+    # package is not installed at all.
+    if not _has_module("docling.docling"):
+        return
 
-        # Resolve the *real* implementation package first.
-        _impl_root = importlib.import_module("docling.docling")
+    try:
+        # Resolve the *real* implementation package first – a plain dict hit
+        # when it has already been imported.
+        if "docling.docling" not in modules:
+            importlib.import_module("docling.docling")
     except ModuleNotFoundError:  # pragma: no cover
         return  # library not available – nothing to alias
 
-    top_mod = sys.modules.get("docling")
+    top_mod = modules.get("docling")
     if top_mod is None:
-        import types as _types_mod
-
-        top_mod = _types_mod.ModuleType("docling")
-        sys.modules["docling"] = top_mod
-
-    # List of first-level sub-packages we want to alias.  Extend as required.
-    _subpackages = [
-        "datamodel",
-        "models",
-        "backend",
-        "chunking",
-        "pipeline",
-        "exceptions",
-        "utils",
-    ]
-
-    for _name in _subpackages:
+        top_mod = types.ModuleType("docling")
+        modules["docling"] = top_mod
+
+    # Sub-packages already imported are taken straight from ``sys.modules``,
+    # the others are registered lazily – the test run only pays for those it
+    # actually touches.  The aliases are collected and registered with a
+    # single ``update``.
+    aliases = {}
+    for _name in _SUBPACKAGES:
         _target = f"docling.docling.{_name}"
-        try:
-            _mod = importlib.import_module(_target)
-        except ModuleNotFoundError:
+        _mod = modules.get(_target) or _lazy_import(_target)
+        if _mod is None:
             continue  # skip missing optional sub-modules
 
-        alias_name = f"docling.{_name}"
-        sys.modules[alias_name] = _mod
+        aliases[f"docling.{_name}"] = _mod
         setattr(top_mod, _name, _mod)
 
+    modules.update(aliases)
+
 
 # ---------------------------------------------------------------------------
 # Kick-off all stub / forwarder installations early during interpreter start-up
 # so that *import* statements in the project encounter the patched modules.
+# The docling forwarders are needed by runtime code as well and therefore run
+# unconditionally; the test-only stubs are gated on ``_UNDER_PYTEST``.
 # ---------------------------------------------------------------------------
 
 
-_install_pytest_check_stub()
-_install_asgi_lifespan_stub()
-_install_websockets_stub()
+if _UNDER_PYTEST:
+    _install_pytest_check_stub()
+    _install_asgi_lifespan_stub()
+    _install_websockets_stub()
 _install_docling_forwarders()
@@ -0,0 +1,100 @@
+"""Regression tests for the sandbox shims in the repository-level *conftest.py*."""
+
+from __future__ import annotations
+
+import inspect
+import os
+import subprocess
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.mark.parametrize("import_mode", ["prepend", "importlib"])
+def test_conftest_loads_with_starlette_installed(tmp_path, import_mode):
+    # A bare-bones *starlette* makes conftest probe ``fastapi.responses``
+    # through the repository's single-file *fastapi.py* shim (prepend mode)
+    # or build its own *fastapi* fallback on top of it (importlib mode).
+    starlette = tmp_path / "starlette"
+    starlette.mkdir()
+    (starlette / "__init__.py").write_text("")
+    (starlette / "responses.py").write_text(
+        "class FileResponse:\n    pass\n\n\n"
+        "class JSONResponse:\n    pass\n\n\n"
+        "class PlainTextResponse:\n    pass\n"
+    )
+    (starlette / "applications.py").write_text("class Starlette:\n    pass\n")
+
+    # Only the fake *starlette* is importable: neither ``PYTHONPATH`` nor the
+    # working directory puts the repository root on ``sys.path``, so the
+    # importlib mode really runs without it.
+    env = dict(os.environ)
+    env["PYTHONPATH"] = str(tmp_path)
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "pytest",
+            "--collect-only",
+            "-q",
+            "-p",
+            "no:cacheprovider",
+            f"--rootdir={PROJECT_ROOT}",
+            f"--import-mode={import_mode}",
+            __file__,
+        ],
+        cwd=tmp_path,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode == 0, result.stdout + result.stderr
+
+
+def _pytest_check_stub():
+    from conftest import _build_pytest_check
+
+    mod = types.ModuleType("pytest_check")
+    _build_pytest_check(mod)
+    return mod.check
+
+
+def test_check_is_in_unhashable_member_with_large_hashable_container():
+    check = _pytest_check_stub()
+
+    with pytest.raises(AssertionError):
+        check.is_in([1, 2], [(1, 2)] * 40)
+
+
+def test_check_is_in_large_containers():
+    check = _pytest_check_stub()
+
+    check.is_in((1, 2), [(1, 2)] * 40)
+    check.is_in([1, 2], [[1, 2]] * 40)
+
+
+class _AsyncMethodHolder:
+    async def test_method(self):
+        return None
+
+
+def test_coroutine_cache_is_keyed_on_functions():
+    from conftest import _IS_CORO_CACHE, pytest_pyfunc_call
+
+    bound = _AsyncMethodHolder().test_method
+    item = types.SimpleNamespace(
+        obj=bound,
+        function=bound.__func__,
+        nodeid="tests/test_conftest.py::_AsyncMethodHolder::test_method",
+        funcargs={},
+        _fixtureinfo=types.SimpleNamespace(argnames=()),
+    )
+
+    assert pytest_pyfunc_call(item) is True
+    assert _IS_CORO_CACHE[_AsyncMethodHolder.test_method] is True
+    assert not any(inspect.ismethod(key) for key in _IS_CORO_CACHE)
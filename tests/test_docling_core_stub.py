@@ -0,0 +1,80 @@
+"""Regression tests for the *docling_core* stand-in (``docling_core_stub.py``)."""
+
+from __future__ import annotations
+
+import copy
+import importlib
+import pickle
+import sys
+import types
+import weakref
+
+from docling_core_stub import BoundingBox
+
+
+def test_bounding_box_copy_leaves_default_boxes_untouched():
+    box = BoundingBox(l=1, t=2, r=3, b=4)
+
+    clone = copy.copy(box)
+
+    assert clone.as_tuple() == (1, 2, 3, 4)
+    assert BoundingBox().as_tuple() == (0.0, 0.0, 0.0, 0.0)
+
+
+def test_bounding_box_pickle_round_trip_leaves_default_boxes_untouched():
+    box = BoundingBox(l=1, t=2, r=3, b=4)
+
+    restored = pickle.loads(pickle.dumps(box))
+
+    assert restored.as_tuple() == (1, 2, 3, 4)
+    assert BoundingBox().as_tuple() == (0.0, 0.0, 0.0, 0.0)
+
+
+def test_bounding_box_mutation_does_not_leak_into_new_boxes():
+    box = BoundingBox()
+    box.r = 10
+
+    fresh = BoundingBox()
+
+    assert fresh is not box
+    assert fresh.r == 0.0
+
+
+def test_doc_star_import_exports_late_assigned_names():
+    namespace: dict = {}
+
+    exec("from docling_core.types.doc import *", namespace)
+
+    assert "PictureDescriptionData" in namespace
+    assert "page" in namespace
+
+
+def test_placeholders_support_weak_references():
+    from docling_core_stub import DocItem, Size
+
+    for obj in (Size(), DocItem(), BoundingBox()):
+        assert weakref.ref(obj)() is obj
+
+
+def test_reload_rebuilds_registered_modules():
+    import docling_core_stub
+
+    stub = importlib.reload(docling_core_stub)
+
+    assert sys.modules["docling_core.types.doc"].BoundingBox is stub.BoundingBox
+
+
+def test_foreign_docling_core_is_replaced_not_patched(monkeypatch):
+    import docling_core_stub
+
+    real = types.ModuleType("docling_core")
+    monkeypatch.setitem(sys.modules, "docling_core", real)
+
+    importlib.reload(docling_core_stub)
+
+    assert sys.modules["docling_core"] is not real
+    assert "__getattr__" not in vars(real)
+    assert not hasattr(real, "DocumentStream")
+
+    monkeypatch.undo()
+    importlib.reload(docling_core_stub)
@@ -0,0 +1,147 @@
+"""Regression tests for the start-up stubs installed by *sitecustomize.py*.
+
+The stubs only exist in a fresh interpreter that has the project root on
+``PYTHONPATH``, so every test runs pytest in a subprocess.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _run_pytest(tmp_path: Path, source: str, *args: str) -> subprocess.CompletedProcess:
+    (tmp_path / "test_generated.py").write_text(textwrap.dedent(source))
+    env = dict(os.environ)
+    env["PYTHONPATH"] = str(PROJECT_ROOT)
+    env.pop("PYTEST_PLUGINS", None)
+    return subprocess.run(
+        [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider", *args, str(tmp_path)],
+        cwd=tmp_path,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+
+
+def test_fixture_and_test_share_one_loop_with_conftest(tmp_path):
+    result = _run_pytest(
+        tmp_path,
+        """
+        import asyncio
+
+        import pytest_asyncio
+
+
+        @pytest_asyncio.fixture()
+        async def fixture_loop():
+            return asyncio.get_running_loop()
+
+
+        async def test_same_loop(fixture_loop):
+            assert fixture_loop is asyncio.get_running_loop()
+        """,
+        "-p",
+        "conftest",
+    )
+
+    assert result.returncode == 0, result.stdout + result.stderr
+
+
+def test_stub_plugin_runs_async_tests_without_touching_the_environment(tmp_path):
+    result = _run_pytest(
+        tmp_path,
+        """
+        import asyncio
+        import os
+
+        import pytest
+        import pytest_asyncio
+
+
+        @pytest_asyncio.fixture()
+        async def value():
+            await asyncio.sleep(0)
+            return 1
+
+
+        async def test_plain(value):
+            assert value == 1
+
+
+        @pytest.mark.asyncio
+        async def test_marked(value):
+            assert value == 1
+
+
+        def test_stub_is_a_plugin(request):
+            assert request.config.pluginmanager.has_plugin("pytest_asyncio")
+            assert "PYTEST_PLUGINS" not in os.environ
+        """,
+        "-p",
+        "conftest",
+        "--strict-markers",
+        "-W",
+        "error",
+    )
+
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert "3 passed" in result.stdout
+
+
+def test_installed_pytest_asyncio_is_not_shadowed(tmp_path):
+    (tmp_path / "pytest_asyncio.py").write_text("REAL = True\n")
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join((str(tmp_path), str(PROJECT_ROOT)))
+    env["PYTEST_CURRENT_TEST"] = "simulated"
+    result = subprocess.run(
+        [sys.executable, "-c", "import pytest_asyncio; assert pytest_asyncio.REAL"],
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode == 0, result.stdout + result.stderr
+
+
+def test_broken_docling_subpackage_is_forgotten(tmp_path):
+    pkg = tmp_path / "docling" / "docling"
+    (pkg / "models").mkdir(parents=True)
+    (pkg / "__init__.py").write_text("")
+    (pkg / "models" / "__init__.py").write_text("import missing_heavy_dependency\n")
+
+    script = textwrap.dedent(
+        """
+        import sys
+
+        import docling.docling
+
+        try:
+            docling.docling.models.anything
+        except ModuleNotFoundError as exc:
+            assert exc.name == "missing_heavy_dependency"
+        else:
+            raise AssertionError("the broken sub-package executed cleanly")
+
+        assert "docling.docling.models" not in sys.modules
+        assert "docling.models" not in sys.modules
+        try:
+            import docling.models
+        except ModuleNotFoundError:
+            pass
+        else:
+            raise AssertionError("the broken alias is still importable")
+        """
+    )
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join((str(tmp_path), str(PROJECT_ROOT)))
+    result = subprocess.run(
+        [sys.executable, "-c", script], env=env, capture_output=True, text=True
+    )
+
+    assert result.returncode == 0, result.stdout + result.stderr